@@ -2,7 +2,6 @@
 Adaptive Replacement Cache (ARC) policy.
 """
 
-from collections import OrderedDict
 from cache_base import CachePolicy
 
 
@@ -11,6 +10,9 @@ class ARCCache(CachePolicy):
     Adaptive Replacement Cache (ARC) policy.
     Maintains two LRU lists: T1 (recency) and T2 (frequency).
     Also maintains ghost lists B1 and B2 for adaptation.
+    
+    All four lists are insertion-ordered dicts: the first key is the LRU end
+    and re-inserting a key moves it to the MRU end.
     """
     
     def __init__(self, capacity: int):
@@ -18,95 +20,111 @@ class ARCCache(CachePolicy):
         self.c = capacity
         self.p = 0
         
-        self.t1 = OrderedDict()
-        self.t2 = OrderedDict()
-        self.b1 = OrderedDict()
-        self.b2 = OrderedDict()
+        self.t1 = {}
+        self.t2 = {}
+        self.b1 = {}
+        self.b2 = {}
     
     def _replace(self, in_b2: bool):
         """Replace a page from cache."""
-        if self.t1 and ((in_b2 and len(self.t1) == self.p) or len(self.t1) > self.p):
-            old, _ = self.t1.popitem(last=False)
-            self.b1[old] = True
-            if len(self.b1) > self.c:
-                self.b1.popitem(last=False)
+        t1 = self.t1
+        n_t1 = len(t1)
+        if n_t1 and ((in_b2 and n_t1 == self.p) or n_t1 > self.p):
+            old = next(iter(t1))
+            del t1[old]
+            b1 = self.b1
+            b1[old] = True
+            if len(b1) > self.c:
+                del b1[next(iter(b1))]
         else:
-            if self.t2:
-                old, _ = self.t2.popitem(last=False)
-                self.b2[old] = True
-                if len(self.b2) > self.c:
-                    self.b2.popitem(last=False)
+            t2 = self.t2
+            if t2:
+                old = next(iter(t2))
+                del t2[old]
+                b2 = self.b2
+                b2[old] = True
+                if len(b2) > self.c:
+                    del b2[next(iter(b2))]
     
     def access(self, item: int) -> bool:
         self.time += 1
+        t1, t2 = self.t1, self.t2
         
-        if item in self.t1:
-            del self.t1[item]
-            self.t2[item] = True
+        if item in t1:
+            del t1[item]
+            t2[item] = True
             self.hits += 1
             return True
         
-        if item in self.t2:
-            self.t2.move_to_end(item)
+        if item in t2:
+            del t2[item]
+            t2[item] = True
             self.hits += 1
             return True
         
         self.misses += 1
+        b1, b2 = self.b1, self.b2
+        c = self.c
+        n_b1, n_b2 = len(b1), len(b2)
         
-        if item in self.b1:
-            delta = max(1, len(self.b2) // max(1, len(self.b1)))
-            self.p = min(self.c, self.p + delta)
+        if item in b1:
+            delta = max(1, n_b2 // max(1, n_b1))
+            self.p = min(c, self.p + delta)
             
             self._replace(False)
-            del self.b1[item]
-            self.t2[item] = True
+            del b1[item]
+            t2[item] = True
             return False
         
-        if item in self.b2:
-            delta = max(1, len(self.b1) // max(1, len(self.b2)))
+        if item in b2:
+            delta = max(1, n_b1 // max(1, n_b2))
             self.p = max(0, self.p - delta)
             
             self._replace(True)
-            del self.b2[item]
-            self.t2[item] = True
+            del b2[item]
+            t2[item] = True
             return False
         
-        l1 = len(self.t1) + len(self.b1)
-        l2 = len(self.t2) + len(self.b2)
+        n_t1 = len(t1)
+        l1 = n_t1 + n_b1
+        l2 = len(t2) + n_b2
         
-        if l1 == self.c:
-            if len(self.t1) < self.c:
-                self.b1.popitem(last=False)
+        if l1 == c:
+            if n_t1 < c:
+                del b1[next(iter(b1))]
                 self._replace(False)
             else:
-                self.t1.popitem(last=False)
-        elif l1 < self.c and l1 + l2 >= self.c:
-            if l1 + l2 >= 2 * self.c:
-                if self.b2:
-                    self.b2.popitem(last=False)
+                del t1[next(iter(t1))]
+        elif l1 < c and l1 + l2 >= c:
+            if l1 + l2 >= 2 * c:
+                if b2:
+                    del b2[next(iter(b2))]
             self._replace(False)
         
-        if len(self.t1) + len(self.t2) >= self.c:
-            if self.t1:
-                old, _ = self.t1.popitem(last=False)
-                self.b1[old] = True
-                if len(self.b1) > self.c:
-                    self.b1.popitem(last=False)
-            elif self.t2:
-                old, _ = self.t2.popitem(last=False)
-                self.b2[old] = True
-                if len(self.b2) > self.c:
-                    self.b2.popitem(last=False)
+        # The branches above may have changed the list sizes
+        if len(t1) + len(t2) >= c:
+            if t1:
+                old = next(iter(t1))
+                del t1[old]
+                b1[old] = True
+                if len(b1) > c:
+                    del b1[next(iter(b1))]
+            elif t2:
+                old = next(iter(t2))
+                del t2[old]
+                b2[old] = True
+                if len(b2) > c:
+                    del b2[next(iter(b2))]
         
-        self.t1[item] = True
+        t1[item] = True
         return False
     
     def reset(self):
         self.p = 0
-        self.t1 = OrderedDict()
-        self.t2 = OrderedDict()
-        self.b1 = OrderedDict()
-        self.b2 = OrderedDict()
+        self.t1.clear()
+        self.t2.clear()
+        self.b1.clear()
+        self.b2.clear()
         self.hits = 0
         self.misses = 0
         self.time = 0
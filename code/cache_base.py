@@ -3,7 +3,7 @@ Base class for cache replacement policies.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Iterable
 
 
 class CachePolicy(ABC):
@@ -28,6 +28,16 @@ class CachePolicy(ABC):
         """Reset the cache to initial state."""
         pass
     
+    def run(self, trace: Iterable[int]) -> Dict:
+        """
+        Replay a whole trace through the cache.
+        Returns the stats after the last access.
+        """
+        access = self.access
+        for item in trace:
+            access(item)
+        return self.get_stats()
+    
     def get_hit_ratio(self) -> float:
         total = self.hits + self.misses
         return self.hits / total if total > 0 else 0.0
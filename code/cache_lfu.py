@@ -2,25 +2,29 @@
 Least Frequently Used (LFU) cache replacement policy.
 """
 
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 from cache_base import CachePolicy
 
 
 class LFUCache(CachePolicy):
-    """Least Frequently Used (LFU) cache replacement policy."""
+    """
+    Least Frequently Used (LFU) cache replacement policy.
+    Ties within a frequency are broken in insertion order (oldest first).
+    """
     
     def __init__(self, capacity: int):
         super().__init__(capacity)
         self.cache = {}
-        self.freq_to_items = defaultdict(OrderedDict)
+        self.freq_to_items = defaultdict(dict)
         self.min_freq = 0
     
     def access(self, item: int) -> bool:
         self.time += 1
         if item in self.cache:
             freq = self.cache[item]
-            del self.freq_to_items[freq][item]
-            if not self.freq_to_items[freq]:
+            bucket = self.freq_to_items[freq]
+            del bucket[item]
+            if not bucket:
                 del self.freq_to_items[freq]
                 if self.min_freq == freq:
                     self.min_freq += 1
@@ -45,8 +49,8 @@ class LFUCache(CachePolicy):
             return False
     
     def reset(self):
-        self.cache = {}
-        self.freq_to_items = defaultdict(OrderedDict)
+        self.cache.clear()
+        self.freq_to_items.clear()
         self.min_freq = 0
         self.hits = 0
         self.misses = 0
@@ -27,7 +27,7 @@ class LRUCache(CachePolicy):
             return False
     
     def reset(self):
-        self.cache = OrderedDict()
+        self.cache.clear()
         self.hits = 0
         self.misses = 0
         self.time = 0
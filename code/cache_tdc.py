@@ -4,9 +4,15 @@ Time-Decayed Caching (TDC) - Proposed Policy
 Combines recency and frequency using exponential time decay.
 """
 
+import heapq
+
 from cache_base import CachePolicy
 
 
+# Weights are rescaled before the per-access boost can overflow a float
+MAX_BOOST = 1e150
+
+
 class TimeDecayedCache(CachePolicy):
     """
     Time-Decayed Caching (TDC) - Proposed Policy
@@ -15,6 +21,18 @@ class TimeDecayedCache(CachePolicy):
     Score(item) = sum over accesses of: decay_rate^(current_time - access_time)
     
     The item with the lowest score is evicted when cache is full.
+    
+    Scores are stored as time-weighted sums projected back to a base time:
+        weight(item) = sum over accesses of: decay_rate^(base_time - access_time)
+                     = Score(item, t) * decay_rate^(base_time - t)
+    Every score decays by the same factor per time step, so a weight only
+    changes when its item is accessed, and ordering by weight is ordering by
+    current score. An access adds boost = decay_rate^(base_time - time),
+    which is kept up to date with one multiplication per time step; all
+    weights are rescaled and base_time moved forward before it overflows.
+    
+    Candidates are kept in a min-heap on weight with lazy deletion. Heap
+    entries superseded by a later access are skipped when they reach the top.
     """
     
     def __init__(self, capacity: int, decay_rate: float = 0.99):
@@ -29,54 +47,74 @@ class TimeDecayedCache(CachePolicy):
         """
         super().__init__(capacity)
         self.decay_rate = decay_rate
-        self.cache = {}  # item -> score
-        self.last_update_time = {}  # item -> last update time
+        self.inv_decay = 1.0 / decay_rate
+        self.boost = 1.0
+        self.cache = {}  # item -> (weight, version)
+        self.heap = []  # (weight, version, item), may contain stale entries
+        self.version = 0
     
-    def _update_score(self, item: int) -> float:
-        """Update and return the current score for an item."""
-        if item not in self.cache:
-            return 0.0
+    def _push(self, item: int, weight: float):
+        """Store the weight for an item and queue it for eviction."""
+        self.version += 1
+        self.cache[item] = (weight, self.version)
+        heapq.heappush(self.heap, (weight, self.version, item))
         
-        time_diff = self.time - self.last_update_time[item]
-        decayed_score = self.cache[item] * (self.decay_rate ** time_diff)
-        return decayed_score
+        if len(self.heap) > 2 * max(1, self.capacity):
+            self._compact()
+    
+    def _compact(self):
+        """Drop stale heap entries left behind by hits and evictions."""
+        self.heap = [
+            entry for entry in self.heap
+            if entry[2] in self.cache and self.cache[entry[2]][1] == entry[1]
+        ]
+        heapq.heapify(self.heap)
+    
+    def _rescale(self):
+        """Move the base time to now, dividing every weight by the current boost."""
+        scale = self.boost
+        self.cache = {
+            item: (weight / scale, version)
+            for item, (weight, version) in self.cache.items()
+        }
+        self.heap = [(weight, version, item) for item, (weight, version) in self.cache.items()]
+        heapq.heapify(self.heap)
+        self.boost = 1.0
+    
+    def _evict(self):
+        """Remove the item with the lowest current score."""
+        while self.heap:
+            _, version, item = heapq.heappop(self.heap)
+            entry = self.cache.get(item)
+            if entry is not None and entry[1] == version:
+                del self.cache[item]
+                return
     
     def access(self, item: int) -> bool:
         self.time += 1
+        self.boost *= self.inv_decay
+        if self.boost > MAX_BOOST:
+            self._rescale()
         
-        if item in self.cache:
-            current_score = self._update_score(item)
-            self.cache[item] = current_score + 1.0
-            self.last_update_time[item] = self.time
+        entry = self.cache.get(item)
+        if entry is not None:
+            self._push(item, entry[0] + self.boost)
             self.hits += 1
             return True
         else:
             self.misses += 1
             
             if len(self.cache) >= self.capacity:
-                min_score = float('inf')
-                min_item = None
-                
-                for cached_item in self.cache:
-                    score = self._update_score(cached_item)
-                    self.cache[cached_item] = score
-                    self.last_update_time[cached_item] = self.time
-                    
-                    if score < min_score:
-                        min_score = score
-                        min_item = cached_item
-                
-                if min_item is not None:
-                    del self.cache[min_item]
-                    del self.last_update_time[min_item]
+                self._evict()
             
-            self.cache[item] = 1.0
-            self.last_update_time[item] = self.time
+            self._push(item, self.boost)
             return False
     
     def reset(self):
-        self.cache = {}
-        self.last_update_time = {}
+        self.cache.clear()
+        self.heap.clear()
+        self.version = 0
+        self.boost = 1.0
         self.hits = 0
         self.misses = 0
         self.time = 0
@@ -3,8 +3,10 @@ Experiment runner for cache evaluation.
 """
 
 import numpy as np
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
 
+from cache_base import CachePolicy
 from cache_tdc import TimeDecayedCache
 from cache_lru import LRUCache
 from cache_lfu import LFUCache
@@ -21,44 +23,99 @@ class ExperimentRunner:
             'LFU': lambda c: LFUCache(c),
             'ARC': lambda c: ARCCache(c)
         }
+        self._pool: Dict[Tuple[str, int], CachePolicy] = {}
+    
+    def _get_cache(self, algorithm_name: str, cache_size: int) -> CachePolicy:
+        """Return an empty cache, reusing one instance per (algorithm, size)."""
+        key = (algorithm_name, cache_size)
+        cache = self._pool.get(key)
+        if cache is None:
+            cache = self.algorithms[algorithm_name](cache_size)
+            self._pool[key] = cache
+        else:
+            cache.reset()
+        return cache
     
     def run_single_experiment(self, trace: np.ndarray, cache_size: int, 
                                algorithm_name: str) -> Dict:
         """Run a single experiment with one algorithm on one trace."""
-        cache = self.algorithms[algorithm_name](cache_size)
+        cache = self._get_cache(algorithm_name, cache_size)
+        return cache.run(trace.tolist())
+    
+    def run_hit_ratio_grid(self, traces: Dict[str, np.ndarray], cache_sizes: Dict[int, int],
+                           max_workers: Optional[int] = None) -> Dict[str, Dict[int, Dict[str, float]]]:
+        """
+        Run every (trace, cache size, algorithm) combination across worker processes.
+        
+        Args:
+            traces: Trace name -> access trace
+            cache_sizes: Label (e.g. cache size in percent) -> cache capacity
+            max_workers: Number of worker processes (default: one per CPU)
         
-        for item in trace:
-            cache.access(int(item))
+        Returns:
+            Hit ratios indexed as results[trace_name][label][algorithm_name].
+            Workers build their own ExperimentRunner, so only the default
+            algorithms are available.
+        """
+        jobs = [
+            (trace_name, label, cache_size, algo_name)
+            for trace_name in traces
+            for label, cache_size in cache_sizes.items()
+            for algo_name in self.algorithms
+        ]
+        results = {trace_name: {label: {} for label in cache_sizes} for trace_name in traces}
+        
+        # Traces are shipped once per worker rather than once per job
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_grid_worker,
+                                 initargs=(traces,)) as executor:
+            for trace_name, label, algo_name, hit_ratio in executor.map(_run_grid_job, jobs):
+                results[trace_name][label][algo_name] = hit_ratio
         
-        return cache.get_stats()
+        return results
     
     def run_sliding_window_experiment(self, trace: np.ndarray, cache_size: int,
-                                       window_size: int = 1000) -> Dict[str, List[float]]:
+                                       window_size: int = 1000) -> Dict[str, np.ndarray]:
         """
         Run experiment tracking sliding window hit ratios.
         
-        Returns hit ratio over time for each algorithm.
-        """
-        results = {name: [] for name in self.algorithms}
-        caches = {name: self.algorithms[name](cache_size) for name in self.algorithms}
+        Each algorithm replays the full trace on its own; the window ratios
+        are then taken from a cumulative sum of its per-request hits.
         
-        # Track hits in sliding window
-        window_hits = {name: [] for name in self.algorithms}
+        Returns hit ratio over time for each algorithm as a float32 array.
+        """
+        results = {}
+        items = trace.tolist()
         
-        for i, item in enumerate(trace):
-            for name, cache in caches.items():
-                hit = cache.access(int(item))
-                window_hits[name].append(1 if hit else 0)
-                
-                # Calculate sliding window hit ratio
-                if i >= window_size:
-                    window = window_hits[name][-window_size:]
-                    hit_ratio = sum(window) / window_size
-                    results[name].append(hit_ratio)
+        for name in self.algorithms:
+            cache = self._get_cache(name, cache_size)
+            hits = np.fromiter(map(cache.access, items), dtype=bool, count=len(items))
+            
+            # Window ending at request i (for i >= window_size) covers
+            # requests i - window_size + 1 .. i
+            hit_counts = np.cumsum(hits)
+            window_hits = hit_counts[window_size:] - hit_counts[:-window_size]
+            results[name] = (window_hits / window_size).astype(np.float32)
         
         return results
 
 
+# Per-process state for run_hit_ratio_grid workers
+_worker_runner = None
+_worker_traces = None
+
+
+def _init_grid_worker(traces: Dict[str, np.ndarray]):
+    global _worker_runner, _worker_traces
+    _worker_runner = ExperimentRunner()
+    _worker_traces = traces
+
+
+def _run_grid_job(job: tuple) -> tuple:
+    trace_name, label, cache_size, algo_name = job
+    stats = _worker_runner.run_single_experiment(_worker_traces[trace_name], cache_size, algo_name)
+    return trace_name, label, algo_name, stats['hit_ratio']
+
+
 def calculate_delta(hit_ratio_proposed: float, hit_ratio_baseline: float) -> float:
     """
     Calculate Delta metric: relative improvement of baseline over proposed.
@@ -49,19 +49,13 @@ def run_all_experiments():
     print("\n[2/4] Running Experiment 1: Computing hit ratios...")
     
     runner = ExperimentRunner()
-    all_results = {}
+    cache_sizes = {
+        cache_pct: max(1, int(NUM_ITEMS * cache_pct / 100))
+        for cache_pct in CACHE_SIZES_PERCENT
+    }
     
-    for trace_name, trace in traces.items():
-        print(f"  Processing: {trace_name}")
-        all_results[trace_name] = {}
-        
-        for cache_pct in CACHE_SIZES_PERCENT:
-            cache_size = max(1, int(NUM_ITEMS * cache_pct / 100))
-            all_results[trace_name][cache_pct] = {}
-            
-            for algo_name in runner.algorithms:
-                stats = runner.run_single_experiment(trace, cache_size, algo_name)
-                all_results[trace_name][cache_pct][algo_name] = stats['hit_ratio']
+    print(f"  Running {len(traces) * len(cache_sizes) * len(runner.algorithms)} jobs in parallel")
+    all_results = runner.run_hit_ratio_grid(traces, cache_sizes)
     
     print("\n[3/4] Computing Delta values and generating table...")
     
@@ -75,7 +69,7 @@ def run_all_experiments():
                 algo_hr = all_results[trace_name][cache_pct][algo]
                 deltas.append(calculate_delta(proposed_hr, algo_hr))
             avg_delta = np.mean(deltas)
-            row.append(f"{avg_delta:+.2f}%")
+            row.append(avg_delta)
         summary_data.append(row)
     
     summary_df = pd.DataFrame(
@@ -83,7 +77,7 @@ def run_all_experiments():
         columns=['Trace', 'Δ vs LRU', 'Δ vs LFU', 'Δ vs ARC']
     )
     
-    create_delta_table_image(summary_df, 'delta_table.png')
+    create_delta_table_image(summary_df, 'delta_table.png', dpi=300, tight=True, final=True)
     
     print("\n[4/4] Running Experiment 2: Sliding window analysis...")
     
@@ -105,7 +99,8 @@ def run_all_experiments():
     create_sliding_window_graph(
         sliding_results, 
         list(non_stationary_traces.keys()),
-        'sliding_window_graph.png'
+        'sliding_window_graph.png',
+        dpi=300, tight=True, final=True
     )
     
     print("\n" + "=" * 60)
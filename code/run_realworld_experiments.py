@@ -6,6 +6,8 @@ Run experiments on the NASA HTTP access log (July 1995).
 
 import numpy as np
 import pandas as pd
+import itertools
+import mmap
 import re
 import os
 
@@ -17,32 +19,41 @@ def parse_nasa_log(filepath: str, max_requests: int = None) -> tuple:
     """
     Parse NASA HTTP access log and extract URL requests.
     
+    The log is memory-mapped and scanned as one bytes buffer. max_requests
+    caps the number of parsed requests (not log lines), and only the pages
+    needed to reach it are read.
+    
     Returns:
         trace: numpy array of integer item IDs
         num_unique: number of unique items
     """
     print(f"  Loading: {filepath}")
     
-    url_pattern = re.compile(r'"[A-Z]+\s+([^\s]+)\s+HTTP')
-    
-    urls = []
-    with open(filepath, 'r', encoding='latin-1') as f:
-        for i, line in enumerate(f):
-            if max_requests and i >= max_requests:
-                break
-            match = url_pattern.search(line)
-            if match:
-                urls.append(match.group(1))
+    # Separators exclude newlines so a match never spans two log lines
+    url_pattern = re.compile(rb'"[A-Z]+[^\S\n]+([^\s]+)[^\S\n]+HTTP')
     
-    print(f"  Parsed {len(urls)} requests")
+    # An empty file cannot be memory-mapped
+    if os.path.getsize(filepath) == 0:
+        print("  Parsed 0 requests")
+        print("  Unique items: 0")
+        return np.empty(0, np.int64), 0
     
-    unique_urls = list(set(urls))
-    url_to_id = {url: idx for idx, url in enumerate(unique_urls)}
-    trace = np.array([url_to_id[url] for url in urls])
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        matches = url_pattern.finditer(mm)
+        if max_requests:
+            matches = itertools.islice(matches, max_requests)
+        
+        # IDs are assigned in order of first appearance
+        url_to_id = {}
+        trace = np.fromiter(
+            (url_to_id.setdefault(match.group(1), len(url_to_id)) for match in matches),
+            dtype=np.int64
+        )
     
-    print(f"  Unique items: {len(unique_urls)}")
+    print(f"  Parsed {len(trace)} requests")
+    print(f"  Unique items: {len(url_to_id)}")
     
-    return trace, len(unique_urls)
+    return trace, len(url_to_id)
 
 
 def run_realworld_experiments():
@@ -65,20 +76,15 @@ def run_realworld_experiments():
     print("\n[2/4] Running Experiment 1: Computing hit ratios...")
     
     runner = ExperimentRunner()
-    all_results = {}
+    cache_sizes = {
+        cache_pct: max(1, int(num_unique * cache_pct / 100))
+        for cache_pct in CACHE_SIZES_PERCENT
+    }
+    all_results = runner.run_hit_ratio_grid(traces, cache_sizes)
     
-    for trace_name, tr in traces.items():
+    for trace_name in traces:
         print(f"  Processing: {trace_name}")
-        all_results[trace_name] = {}
-        
         for cache_pct in CACHE_SIZES_PERCENT:
-            cache_size = max(1, int(num_unique * cache_pct / 100))
-            all_results[trace_name][cache_pct] = {}
-            
-            for algo_name in runner.algorithms:
-                stats = runner.run_single_experiment(tr, cache_size, algo_name)
-                all_results[trace_name][cache_pct][algo_name] = stats['hit_ratio']
-            
             print(f"    Cache {cache_pct}%: Proposed={all_results[trace_name][cache_pct]['Proposed']:.3f}, "
                   f"LRU={all_results[trace_name][cache_pct]['LRU']:.3f}, "
                   f"LFU={all_results[trace_name][cache_pct]['LFU']:.3f}, "
@@ -96,7 +102,7 @@ def run_realworld_experiments():
                 algo_hr = all_results[trace_name][cache_pct][algo]
                 deltas.append(calculate_delta(proposed_hr, algo_hr))
             avg_delta = np.mean(deltas)
-            row.append(f"{avg_delta:+.2f}%")
+            row.append(avg_delta)
         summary_data.append(row)
     
     summary_df = pd.DataFrame(
@@ -104,7 +110,7 @@ def run_realworld_experiments():
         columns=['Trace', 'Δ vs LRU', 'Δ vs LFU', 'Δ vs ARC']
     )
     
-    create_delta_table_image(summary_df, 'delta_table_realworld.png')
+    create_delta_table_image(summary_df, 'delta_table_realworld.png', dpi=300, tight=True, final=True)
     
     # Run Experiment 2: Sliding window analysis
     print("\n[4/4] Running Experiment 2: Sliding window analysis...")
@@ -122,7 +128,8 @@ def run_realworld_experiments():
     create_sliding_window_graph(
         sliding_results, 
         list(traces.keys()),
-        'sliding_window_realworld.png'
+        'sliding_window_realworld.png',
+        dpi=300, tight=True, final=True
     )
     
     print("\n" + "=" * 60)
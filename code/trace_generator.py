@@ -2,10 +2,29 @@
 Synthetic trace generators for cache evaluation.
 """
 
+import functools
 import numpy as np
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=None)
+def _zipf_cdf(num_items: int, alpha: float) -> np.ndarray:
+    """Cumulative Zipf distribution over ranks 1..num_items (read-only, shared)."""
+    ranks = np.arange(1, num_items + 1)
+    probabilities = 1.0 / (ranks ** alpha)
+    cdf = np.cumsum(probabilities)
+    cdf /= cdf[-1]
+    cdf.flags.writeable = False
+    return cdf
+
+
+def _sample_zipf(rng: np.random.Generator, num_items: int, alpha: float,
+                 size: int) -> np.ndarray:
+    """Draw `size` Zipf-distributed indices in [0, num_items)."""
+    u = rng.random(size)
+    return np.searchsorted(_zipf_cdf(num_items, alpha), u, side='right')
+
+
 class TraceGenerator:
     """Generate synthetic access traces for cache evaluation."""
     
@@ -24,15 +43,8 @@ class TraceGenerator:
         Returns:
             Array of item IDs representing the access trace
         """
-        if seed is not None:
-            np.random.seed(seed)
-        
-        ranks = np.arange(1, num_items + 1)
-        probabilities = 1.0 / (ranks ** alpha)
-        probabilities /= probabilities.sum()
-        
-        trace = np.random.choice(num_items, size=num_requests, p=probabilities)
-        return trace
+        rng = np.random.default_rng(seed)
+        return _sample_zipf(rng, num_items, alpha, num_requests)
     
     @staticmethod
     def non_stationary_phases(num_items: int, num_phases: int, phase_length: int,
@@ -55,28 +67,21 @@ class TraceGenerator:
         Returns:
             Array of item IDs representing the access trace
         """
-        if seed is not None:
-            np.random.seed(seed)
-        
-        trace = []
+        rng = np.random.default_rng(seed)
         hot_set_size = num_items // 4
-
+        trace = np.empty(num_phases * phase_length, dtype=np.int64)
+        
         for phase in range(num_phases):
             hot_start = (phase * hot_set_size) % (num_items - hot_set_size)
-            hot_items = np.arange(hot_start, hot_start + hot_set_size)
-            cold_items = np.array([i for i in range(num_items) if i not in hot_items])
-            
-            ranks = np.arange(1, len(hot_items) + 1)
-            hot_probs = 1.0 / (ranks ** alpha)
-            hot_probs /= hot_probs.sum()
+            is_cold = np.ones(num_items, dtype=bool)
+            is_cold[hot_start:hot_start + hot_set_size] = False
+            cold_items = np.flatnonzero(is_cold)
             
-            cold_probs = np.ones(len(cold_items)) / len(cold_items)
+            is_hot = rng.random(phase_length) < p_hot
+            hot_samples = hot_start + _sample_zipf(rng, hot_set_size, alpha, phase_length)
+            cold_samples = rng.choice(cold_items, size=phase_length)
             
-            for _ in range(phase_length):
-                if np.random.random() < p_hot:
-                    item = np.random.choice(hot_items, p=hot_probs)
-                else:
-                    item = np.random.choice(cold_items, p=cold_probs)
-                trace.append(item)
+            start = phase * phase_length
+            trace[start:start + phase_length] = np.where(is_hot, hot_samples, cold_samples)
         
-        return np.array(trace)
+        return trace
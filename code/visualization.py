@@ -1,97 +1,295 @@
 """
 Visualization functions for cache experiment results.
+
+Every public function takes dpi, tight and final. The defaults favour fast
+previews; pass dpi=300, tight=True, final=True for the final figure (tight
+cropping costs an extra draw, final turns on maximum PNG compression).
+Sliding window plots with no data at all write a 1x1 transparent
+placeholder PNG instead.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # non-interactive backend
+import contextlib
+import gc
+
+import matplotlib.image as mpimg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+import numpy as np
 import pandas as pd
-from typing import Dict, List
-
-
-def create_delta_table_image(results_df: pd.DataFrame, output_path: str):
-    """Create a publication-ready summary table image of average Delta values."""
-    fig, ax = plt.subplots(figsize=(10, 4))
-    ax.axis('off')
-    
-    table = ax.table(
-        cellText=results_df.values,
-        colLabels=results_df.columns,
-        cellLoc='center',
-        loc='center',
-        colWidths=[0.45, 0.18, 0.18, 0.18]
-    )
-    
-    table.auto_set_font_size(False)
-    table.set_fontsize(11)
-    table.scale(1.4, 2.0)
-    
-    for i in range(len(results_df.columns)):
-        table[(0, i)].set_facecolor('#4472C4')
-        table[(0, i)].set_text_props(color='white', fontweight='bold')
-    
-    for i in range(len(results_df)):
-        for j in range(len(results_df.columns)):
-            if i % 2 == 0:
-                table[(i + 1, j)].set_facecolor('#E9EDF4')
-            else:
-                table[(i + 1, j)].set_facecolor('#FFFFFF')
-            
-            if j == 0:
-                table[(i + 1, j)].set_text_props(fontweight='bold')
-    
-    plt.title('Average Δ(j, c, Proposed) Across All Cache Sizes (%)\n' + 
-              '(Positive = Proposed outperforms baseline)',
-              fontsize=12, fontweight='bold', pad=20)
-    
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close()
-    print(f"Delta table saved to: {output_path}")
+from typing import Dict, Iterator, List, Tuple
 
 
-def create_sliding_window_graph(results: Dict[str, Dict[str, List[float]]], 
-                                 trace_names: List[str],
-                                 output_path: str):
-    """Create sliding window hit ratio graphs for non-stationary traces."""
-    n_traces = len(trace_names)
-    fig, axes = plt.subplots(1, n_traces, figsize=(7 * n_traces, 5))
-    
-    if n_traces == 1:
-        axes = [axes]
-    
-    colors = {
+# Figures are drawn straight onto Agg canvases, outside pyplot's figure manager
+_FIG_CACHE: Dict[Tuple[float, float], Figure] = {}
+
+# Line colour per algorithm, parsed to RGBA once
+_COLORS = {
+    name: to_rgba(hex_color) for name, hex_color in {
         'Proposed': '#2E86AB',
-        'LRU': '#A23B72', 
+        'LRU': '#A23B72',
         'LFU': '#F18F01',
         'ARC': '#C73E1D'
+    }.items()
+}
+
+# Fixed hit ratio ticks; the inner ones also carry the gridlines
+_Y_TICKS = np.linspace(0, 1, 6)
+
+
+def _png_options(final: bool) -> Dict:
+    """Pillow PNG settings: fast compression for previews, smallest file when final."""
+    return {'compress_level': 9, 'optimize': True} if final else {'compress_level': 1}
+
+
+def _save(fig: Figure, output_path: str, dpi: int, tight: bool, final: bool):
+    """Write fig as a PNG on a white background."""
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight' if tight else None,
+                facecolor='white', edgecolor='none', pil_kwargs=_png_options(final))
+
+
+def _write_placeholder(trace_results: List[Dict[str, np.ndarray]], output_path: str) -> bool:
+    """
+    Write a 1x1 transparent PNG if none of the given series has any points.
+    
+    Returns True if the placeholder was written, in which case the caller
+    skips building a figure.
+    """
+    if any(len(hit_ratios) for results in trace_results for hit_ratios in results.values()):
+        return False
+    mpimg.imsave(output_path, np.zeros((1, 1, 4)))
+    print(f"No sliding window data; placeholder saved to: {output_path}")
+    return True
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a line to n_out points with Largest-Triangle-Three-Buckets.
+    
+    Unlike every-Nth sampling, this keeps the peaks and dips that shape the
+    line. The first and last points are always kept.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    # Inner points are split into n_out - 2 buckets; one point is kept per bucket
+    edges = (np.arange(n_out - 1) * (n - 2) // (n_out - 2)) + 1
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    
+    # Each bucket is scored against the average of the bucket after it
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+    
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - next_x[i]) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (next_y[i] - y[a]))
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    
+    return x[selected], y[selected]
+
+
+@contextlib.contextmanager
+def _figure(figsize: Tuple[float, float]) -> Iterator[Figure]:
+    """
+    Lend out the cached figure of the given size for one render.
+    
+    One figure per size is kept and reused, so repeated renders skip figure
+    construction. On exit, even after an error, the figure is cleared and a
+    collection is forced, so the plotted data is not kept alive between
+    calls and memory stays bounded across long batches of plots.
+    """
+    fig = _FIG_CACHE.get(figsize)
+    if fig is None:
+        fig = Figure(figsize=figsize, layout='constrained')
+        FigureCanvasAgg(fig)
+        _FIG_CACHE[figsize] = fig
+    try:
+        yield fig
+    finally:
+        fig.clear()
+        gc.collect()
+
+
+def _draw_sliding_window_panel(ax, trace_results: Dict[str, np.ndarray]
+                               ) -> Tuple[List[Line2D], List[str]]:
+    """
+    Draw one trace's hit ratio series onto ax, with fixed y ticks and gridlines.
+    
+    Returns legend handles and labels for the caller to place.
+    """
+    trace_results = {
+        algo_name: np.ascontiguousarray(hit_ratios, dtype=np.float32)
+        for algo_name, hit_ratios in trace_results.items()
     }
     
-    for ax, trace_name in zip(axes, trace_names):
-        trace_results = results[trace_name]
-        
-        for algo_name, hit_ratios in trace_results.items():
-            step = max(1, len(hit_ratios) // 500)
-            x = list(range(0, len(hit_ratios), step))
-            y = [hit_ratios[i] for i in x]
-            
-            ax.plot(x, y, label=algo_name, color=colors[algo_name], 
-                   linewidth=1.5, alpha=0.9)
-        
-        ax.set_xlabel('Request Number', fontsize=11)
-        ax.set_ylabel('Sliding Window Hit Ratio', fontsize=11)
-        ax.set_title(f'{trace_name}', fontsize=12, fontweight='bold')
-        ax.legend(loc='lower right', fontsize=9)
-        ax.grid(True, alpha=0.3)
-        ax.set_ylim(0, 1)
-    
-    plt.suptitle('Algorithm Adaptability: Sliding Window Hit Ratio Over Time\n' +
-                 '(Non-Stationary Traces with Phase Changes)', 
-                 fontsize=13, fontweight='bold', y=1.02)
-    
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    # All algorithms go into one LineCollection instead of one Line2D each
+    algo_names = list(trace_results)
+    segments = [
+        np.column_stack(_lttb(np.arange(hit_ratios.size), hit_ratios, 500))
+        for hit_ratios in trace_results.values()
+    ]
+    colors = [_COLORS[algo_name] for algo_name in algo_names]
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=1.5,
+                                     alpha=0.9, joinstyle='round'))
+    ax.autoscale_view()
+    ax.set_ylim(0, 1)
+    ax.set_yticks(_Y_TICKS)
+    
+    # Horizontal gridlines as one collection spanning the axes width,
+    # instead of a gridline artist per tick
+    ax.grid(False)
+    ax.hlines(_Y_TICKS[1:-1], 0, 1, transform=ax.get_yaxis_transform(),
+              colors='#CCCCCC', linewidths=0.5, alpha=0.3, zorder=0)
+    
+    # The collection has no per-line labels, so the legend uses proxy lines
+    handles = [Line2D([], [], color=color, linewidth=1.5, alpha=0.9)
+               for color in colors]
+    return handles, algo_names
+
+
+def create_delta_table_image(results_df: pd.DataFrame, output_path: str,
+                             dpi: int = 150, tight: bool = False, final: bool = False):
+    """
+    Create a publication-ready summary table image of average Delta values.
+    
+    Numeric cells are shown as signed percentages (e.g. +1.23%); other
+    cells are shown as-is.
+    """
+    with _figure((10, 4)) as fig:
+        ax = fig.subplots()
+        ax.axis('off')
+        
+        values = results_df.to_numpy(copy=False)
+        columns = results_df.columns.tolist()
+        n_rows, n_cols = values.shape
+        
+        # Numeric view of the table (NaN for text cells) for formatting and coloring
+        numeric = np.array([
+            [v if isinstance(v, (float, np.floating)) else np.nan for v in row]
+            for row in values
+        ], dtype=float)
+        cell_text = [
+            [str(v) if np.isnan(x) else f"{x:+.2f}%" for v, x in zip(row, numeric_row)]
+            for row, numeric_row in zip(values, numeric)
+        ]
+        
+        table = ax.table(
+            cellText=cell_text,
+            colLabels=columns,
+            cellLoc='center',
+            loc='center',
+            colWidths=[0.45, 0.18, 0.18, 0.18]
+        )
+        
+        table.auto_set_font_size(False)
+        table.set_fontsize(11)
+        table.scale(0.95, 2.0)
+        
+        # Header row, then body cells: green where Proposed wins, red where it
+        # loses, alternating row shading for text and zero cells
+        row_colors = np.where(np.arange(n_rows) % 2 == 0, '#E9EDF4', '#FFFFFF')[:, None]
+        face_colors = np.empty((n_rows + 1, n_cols), dtype=object)
+        face_colors[0] = '#4472C4'
+        face_colors[1:] = np.where(numeric > 0, '#C6EFCE',
+                                   np.where(numeric < 0, '#FFC7CE', row_colors))
+        
+        for (row, col), cell in table.get_celld().items():
+            cell.set_facecolor(face_colors[row, col])
+            if row == 0:
+                cell.set_text_props(color='white', fontweight='bold')
+            elif col == 0:
+                cell.set_text_props(fontweight='bold')
+        
+        ax.set_title('Average Δ(j, c, Proposed) Across All Cache Sizes (%)\n' + 
+                     '(Positive = Proposed outperforms baseline)',
+                     fontsize=12, fontweight='bold', pad=20)
+        
+        _save(fig, output_path, dpi, tight, final)
+    print(f"Delta table saved to: {output_path}")
+
+
+def create_sliding_window_graph(results: Dict[str, Dict[str, np.ndarray]], 
+                                 trace_names: List[str],
+                                 output_path: str,
+                                 dpi: int = 150, tight: bool = False, final: bool = False):
+    """
+    Create sliding window hit ratio graphs for non-stationary traces.
+    
+    results maps trace name -> algorithm name -> hit ratio series. Series
+    are used as contiguous float32 arrays; anything else (e.g. a list of
+    floats) is converted once on entry.
+    """
+    if _write_placeholder([results[trace_name] for trace_name in trace_names], output_path):
+        return
+    
+    n_traces = len(trace_names)
+    with _figure((7 * n_traces, 5)) as fig:
+        axes = fig.subplots(1, n_traces)
+        
+        if n_traces == 1:
+            axes = [axes]
+        
+        for ax, trace_name in zip(axes, trace_names):
+            handles, algo_names = _draw_sliding_window_panel(ax, results[trace_name])
+            ax.set_xlabel('Request Number', fontsize=11)
+            ax.set_ylabel('Sliding Window Hit Ratio', fontsize=11)
+            ax.set_title(f'{trace_name}', fontsize=12, fontweight='bold')
+            ax.legend(handles, algo_names, loc='lower right', fontsize=9)
+        
+        fig.suptitle('Algorithm Adaptability: Sliding Window Hit Ratio Over Time\n' +
+                     '(Non-Stationary Traces with Phase Changes)', 
+                     fontsize=13, fontweight='bold')
+        
+        _save(fig, output_path, dpi, tight, final)
     print(f"Sliding window graph saved to: {output_path}")
+
+
+def create_sliding_window_grid(results_by_cachesize: Dict[object, Dict[str, Dict[str, np.ndarray]]],
+                               trace_names: List[str],
+                               output_path: str,
+                               dpi: int = 150, tight: bool = False, final: bool = False):
+    """
+    Create one figure of sliding window hit ratio graphs for several cache sizes.
+    
+    results_by_cachesize maps a cache size label (e.g. percent of unique
+    items) -> trace name -> algorithm name -> hit ratio series, i.e. one
+    create_sliding_window_graph results dict per cache size. Each cache
+    size gets a row and each trace a column; all panels share their axes
+    and a single legend, and the figure is saved once.
+    """
+    if _write_placeholder([results[trace_name] for results in results_by_cachesize.values()
+                           for trace_name in trace_names], output_path):
+        return
+    
+    n_sizes, n_traces = len(results_by_cachesize), len(trace_names)
+    with _figure((7 * n_traces, 5 * n_sizes)) as fig:
+        axes = fig.subplots(n_sizes, n_traces, sharex=True, sharey=True, squeeze=False)
+        
+        for row, (label, results) in zip(axes, results_by_cachesize.items()):
+            for ax, trace_name in zip(row, trace_names):
+                handles, algo_names = _draw_sliding_window_panel(ax, results[trace_name])
+                ax.set_title(f'{trace_name} (cache size {label})', fontsize=12, fontweight='bold')
+        
+        for ax in axes[-1]:
+            ax.set_xlabel('Request Number', fontsize=11)
+        for ax in axes[:, 0]:
+            ax.set_ylabel('Sliding Window Hit Ratio', fontsize=11)
+        
+        fig.legend(handles, algo_names, loc='outside lower center',
+                   ncols=len(algo_names), fontsize=10)
+        fig.suptitle('Algorithm Adaptability: Sliding Window Hit Ratio Over Time\n' +
+                     '(Non-Stationary Traces with Phase Changes)', 
+                     fontsize=13, fontweight='bold')
+        
+        _save(fig, output_path, dpi, tight, final)
+    print(f"Sliding window grid saved to: {output_path}")